@@ -0,0 +1,187 @@
+"""
+Parameter Sweep Module
+여러 PID 게인 조합을 한 번에 시뮬레이션하고 성능을 비교하는 모듈
+"""
+
+import multiprocessing
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import product
+from numba import njit, prange
+from temperature_system import TemperatureSystem, _FASTMATH, _batch_step, run_simulation
+from ui_plot import analyze_performance
+
+
+# 스윕 커널이 한 번에 진행하는 게인 조합 수 (SIMD 레인 수)
+# float64 기준 AVX2는 4개, AVX-512는 8개가 한 레지스터에 들어감
+# (JIT 컴파일 시 상수로 고정되므로 실행 중에 바꿔도 반영되지 않음)
+SWEEP_LANES = 4
+
+@njit(parallel=True, fastmath=_FASTMATH, cache=True)
+def _sweep(gains, n, sp, dt, T0, Tamb, decay, gain, abort_temp, out_mse, out_overshoot):
+    """
+    게인 조합별 시뮬레이션 (병렬 JIT 커널)
+
+    조합끼리 공유하는 상태가 없으므로 SWEEP_LANES개씩 묶은 블록을
+    prange로 코어마다 나눠서 실행하고, 블록 안에서는 _batch_step()으로
+    레인 전체를 한 번에 진행 (코어 병렬 + SIMD 병렬).
+    시계열은 저장하지 않고 MSE와 오버슈트만 계산함
+
+    매개변수:
+        gains: (M, 3) 배열, 각 행이 (Kp, Ki, Kd) (M은 SWEEP_LANES의 배수)
+        n: 반복 횟수
+        sp, dt, T0, Tamb, decay, gain: _simulate()와 동일
+        abort_temp: 이 온도를 넘으면 발산으로 보고 해당 조합 중단 (°C)
+        out_mse: (M,) 결과 배열 - 평균 제곱 오차
+        out_overshoot: (M,) 결과 배열 - 최대 오버슈트 (°C)
+    """
+    inv_dt = 1.0 / dt
+    for b in prange(gains.shape[0] // SWEEP_LANES):
+        lo = b * SWEEP_LANES
+        hi = lo + SWEEP_LANES
+
+        # 레인별 게인과 상태 (길이 = 레인 수)
+        Kp = gains[lo:hi, 0].copy()
+        Ki = gains[lo:hi, 1].copy()
+        Kd = gains[lo:hi, 2].copy()
+        T = np.full(SWEEP_LANES, T0)
+        integral = np.zeros(SWEEP_LANES)
+        prev = np.zeros(SWEEP_LANES)
+        sum_err2 = np.zeros(SWEEP_LANES)
+        max_T = T.copy()
+        aborted = np.zeros(SWEEP_LANES, dtype=np.bool_)
+
+        for i in range(n):
+            # 업데이트 전 온도 기준으로 집계 (run_simulation 기록과 동일)
+            # np.max처럼 NaN이 나오면 NaN을 유지하도록 비교 방향을 정함
+            for j in range(SWEEP_LANES):
+                if not T[j] <= max_T[j]:
+                    max_T[j] = T[j]
+
+            _batch_step(T, integral, prev, sp, Kp, Ki, Kd,
+                        dt, inv_dt, decay, gain, Tamb)
+
+            # prev = 이번 스텝의 오차
+            # 발산한 레인은 표시만 해두고, 모든 레인이 발산하면 블록 전체 중단
+            # (히터 출력이 0~100%로 제한되고 정확한 해를 쓰므로 온도는
+            #  min(T0, Tamb) ~ Tamb + 100 × gain 범위를 벗어나지 않음 → 하한 검사는 불필요)
+            n_aborted = 0
+            for j in range(SWEEP_LANES):
+                sum_err2[j] += prev[j] * prev[j]
+                aborted[j] |= T[j] > abort_temp
+                n_aborted += aborted[j]
+            if n_aborted == SWEEP_LANES:
+                break
+
+        # 발산한 조합은 지표를 inf로
+        for j in range(SWEEP_LANES):
+            if aborted[j]:
+                out_mse[lo + j] = np.inf
+                out_overshoot[lo + j] = np.inf
+            else:
+                out_mse[lo + j] = sum_err2[j] / n
+                out_overshoot[lo + j] = max_T[j] - sp
+
+
+def run_sweep(Kps, Kis, Kds, target_temp=200, sim_time=300, abort_temp=None):
+    """
+    PID 게인 격자 탐색 - 모든 (Kp, Ki, Kd) 조합을 병렬로 시뮬레이션
+    
+    매개변수:
+        Kps, Kis, Kds: 각 게인의 후보 값 목록
+        target_temp: 목표 온도 (°C)
+        sim_time: 시뮬레이션 시간 (초)
+        abort_temp: 이 온도를 넘으면 해당 조합을 중단 (°C, None이면 목표 온도의 5배)
+                    펌웨어의 MAXTEMP 보호처럼 실제 허용 온도로 낮춰 쓰면
+                    불안정한 게인을 일찍 걸러낼 수 있음
+                    float('inf')를 주면 상한 중단을 끔
+        
+    반환값:
+        'gains' (M, 3), 'mse' (M,), 'overshoot' (M,) 배열을 담은 딕셔너리
+        (중단된 조합은 mse, overshoot가 inf → argmin으로 최적 조합을 바로 찾을 수 있음)
+    """
+    # 1. 시뮬레이션 설정 (run_simulation과 동일)
+    dt = 0.1
+    time_steps = int(sim_time / dt)
+    system = TemperatureSystem(initial_temp=25, ambient_temp=25)
+    decay, gain = system.step_coefficients(dt)
+    if abort_temp is None:
+        abort_temp = target_temp * 5.0
+    
+    # 2. 게인 조합 펼치기 → (M, 3)
+    gains = np.array(np.meshgrid(Kps, Kis, Kds, indexing='ij'),
+                     dtype=np.float64).reshape(3, -1).T.copy()
+    
+    # 3. 레인 수의 배수가 되도록 마지막 조합을 복사해서 채움 (결과는 나중에 잘라냄)
+    M = gains.shape[0]
+    pad = -M % SWEEP_LANES
+    padded = np.concatenate([gains, np.repeat(gains[-1:], pad, axis=0)]) if pad else gains
+    
+    # 4. 병렬 커널 실행 (조합당 스칼라 지표만 저장)
+    mse = np.empty(padded.shape[0])
+    overshoot = np.empty(padded.shape[0])
+    _sweep(padded, time_steps, float(target_temp), dt,
+           float(system.temp), float(system.ambient), decay, gain,
+           float(abort_temp), mse, overshoot)
+    
+    return {
+        'gains': gains,
+        'mse': mse[:M],
+        'overshoot': overshoot[:M]
+    }
+
+
+def _run_one(g, target_temp, sim_time):
+    """
+    run_grid()의 작업 단위 - 게인 한 조합 시뮬레이션 후 스칼라 지표만 반환
+    (시계열 배열을 프로세스 간에 주고받지 않도록)
+    """
+    Kp, Ki, Kd = g
+    data = run_simulation(Kp, Ki, Kd, target_temp=target_temp, sim_time=sim_time)
+    perf = analyze_performance(data)
+    return perf['mse'], perf['overshoot'], perf['settling_time']
+
+
+def run_grid(Kps, Kis, Kds, target_temp=200, sim_time=300, max_workers=None):
+    """
+    PID 게인 격자 탐색 - 조합마다 run_simulation()을 여러 프로세스에서 실행
+    
+    run_sweep()보다 느리지만 run_simulation()/analyze_performance()를 그대로
+    사용하므로 정상상태 도달 시간까지 구할 수 있음
+    
+    작업 프로세스는 spawn 방식으로 새로 시작하므로, 스크립트에서 호출할 때는
+    `if __name__ == "__main__":` 안에서 호출해야 함
+    
+    매개변수:
+        Kps, Kis, Kds: 각 게인의 후보 값 목록
+        target_temp: 목표 온도 (°C)
+        sim_time: 시뮬레이션 시간 (초)
+        max_workers: 프로세스 수 (None이면 CPU 코어 수)
+        
+    반환값:
+        'gains' (M, 3), 'mse' (M,), 'overshoot' (M,),
+        'settling_time' (M,, 수렴하지 못하면 NaN) 배열을 담은 딕셔너리
+    """
+    grid = list(product(Kps, Kis, Kds))
+    run_one = partial(_run_one, target_temp=target_temp, sim_time=sim_time)
+    workers = max_workers or os.cpu_count() or 1
+    
+    # 프로세스마다 GIL이 따로 있으므로 코어 수만큼 병렬 실행
+    # 작업을 묶어서 보내 프로세스 간 통신 횟수를 줄임
+    chunksize = max(1, len(grid) // (workers * 4))
+    # fork 대신 spawn 사용 - run_sweep()이 먼저 실행됐다면 Numba 병렬 스레드 풀이
+    # 살아 있는 상태에서 fork 되어 종료 시 멈출 수 있음
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as ex:
+        results = list(ex.map(run_one, grid, chunksize=chunksize))
+    
+    mse, overshoot, settling_time = zip(*results) if results else ((), (), ())
+    return {
+        'gains': np.array(grid, dtype=np.float64).reshape(-1, 3),
+        'mse': np.array(mse, dtype=np.float64),
+        'overshoot': np.array(overshoot, dtype=np.float64),
+        'settling_time': np.array(
+            [np.nan if t is None else t for t in settling_time], dtype=np.float64)
+    }
@@ -11,6 +11,9 @@ class PIDController:
     -D(미분): 오차의 변화율로 미래를 예측해서 오버슈트 감소
     """
     
+    # 인스턴스 __dict__ 대신 고정 슬롯 사용 (메모리 절약, 속성 접근 빠름)
+    __slots__ = ('Kp', 'Ki', 'Kd', 'setpoint', 'integral', 'prev_error')
+    
     def __init__(self, Kp, Ki, Kd, setpoint=0.0):
         """
         PID 제어기 초기화
@@ -45,27 +48,35 @@ class PIDController:
         제어 출력 값
         """
 
+        # 속성을 지역 변수로 한 번만 읽어둠 (self.xxx 반복 조회 방지)
+        Kp = self.Kp
+        Ki = self.Ki
+        Kd = self.Kd
+        integral = self.integral
+        prev_error = self.prev_error
+
         # 오차 계산 = 목표값 - 현재값
         error = self.setpoint - current_value
         
         # 2. P (비례 항) - 현재 오차에 비례
         # 오차가 크면 큰 출력, 작으면 작은 출력
-        P = self.Kp * error
+        P = Kp * error
         
         #3. I(적분 항) - 오차를 시간에 따라 누적
         #   과거의 모든 오차를 더함 -> 정상상태 오차 제거
-        self.integral += error * dt
-        I = self.Ki * self.integral
+        integral += error * dt
+        I = Ki * integral
         
         #4. D (미분 항) - 오차의 변화율로
         # 오차가 빠르게 변하면 미리 대응 -> 오버슈트 감소
         if dt > 0:
-            derivative = (error - self.prev_error) / dt
+            derivative = (error - prev_error) / dt
         else:
             derivative = 0
-        D = self.Kd * derivative
+        D = Kd * derivative
         
-        #5. 다음 계산을 위해 현재 오차 저장
+        #5. 다음 계산을 위해 적분값과 현재 오차 저장
+        self.integral = integral
         self.prev_error = error
         
         #6. PID 출력 = P + I + D
@@ -0,0 +1,81 @@
+# cython: language_level=3
+"""
+PID Controller Module (Cython 버전)
+pid_controller.py와 같은 API를 C 수준 타입으로 구현한 모듈
+
+시뮬레이션(run_simulation, 파라미터 스윕)은 Numba JIT 커널로 돌기 때문에
+이 클래스를 쓰지 않음. 외부 프로그램이나 HIL(실제 하드웨어 연동) 루프에서
+PID 제어기만 따로 C 속도로 쓰고 싶을 때를 위한 독립 빌드
+    빌드: python setup.py build_ext --inplace
+    (같은 폴더의 pid_controller.py 대신 확장 모듈이 import 됨)
+"""
+
+cimport cython
+
+
+cdef class PIDController:
+    """
+    PID 제어기 클래스 (Cython)
+    -P(비례): 현재 오차에 비례해서 반응
+    -I(적분): 과거 오차를 누적하여 정상상태 오차 제거
+    -D(미분): 오차의 변화율로 미래를 예측해서 오버슈트 감소
+    """
+
+    # 속성을 C double로 고정 (파이썬에서도 읽기/쓰기 가능)
+    cdef public double Kp, Ki, Kd
+    cdef public double setpoint
+    cdef public double integral, prev_error
+
+    def __init__(self, double Kp, double Ki, double Kd, double setpoint=0.0):
+        """
+        PID 제어기 초기화
+
+        매개변수:
+        Kp: 비례 게인
+        Ki: 적분 게인
+        Kd: 미분 게인
+        setpoint: 목표값
+        """
+        self.Kp = Kp
+        self.Ki = Ki
+        self.Kd = Kd
+        self.setpoint = setpoint
+        self.integral = 0.0
+        self.prev_error = 0.0
+
+    @cython.cdivision(True)
+    cpdef tuple update(self, double current_value, double dt):
+        """
+        PID 제어 출력 계산
+
+        매개변수:
+        current_value: 현재 측정값
+        dt: 시간 간격
+
+        반환값:
+        (제어 출력, P, I, D)
+        """
+        cdef double error, P, I, D, derivative
+
+        error = self.setpoint - current_value
+        P = self.Kp * error
+
+        self.integral += error * dt
+        I = self.Ki * self.integral
+
+        if dt > 0:
+            derivative = (error - self.prev_error) / dt
+        else:
+            derivative = 0.0
+        D = self.Kd * derivative
+
+        self.prev_error = error
+
+        return P + I + D, P, I, D
+
+    cpdef reset(self):
+        """
+        PID 제어기 초기화 (적분, 미분 항 리셋)
+        """
+        self.integral = 0.0
+        self.prev_error = 0.0
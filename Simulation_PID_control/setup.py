@@ -0,0 +1,22 @@
+"""
+Cython 확장 모듈 빌드 스크립트
+pid_controller.pyx → pid_controller 확장 모듈
+(외부/HIL 연동용 독립 빌드, 시뮬레이션 코드는 사용하지 않음)
+
+사용법:
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup, Extension
+from Cython.Build import cythonize
+
+
+extensions = [
+    Extension('pid_controller', ['pid_controller.pyx']),
+]
+
+setup(
+    name='pid-controller',
+    py_modules=[],
+    ext_modules=cythonize(extensions, language_level=3),
+)
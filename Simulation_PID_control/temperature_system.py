@@ -3,8 +3,14 @@ Temperature System Simulation Module
 온도 시스템 시뮬레이션과 실행 로직을 담당하는 모듈
 """
 
+import math
 import numpy as np
-from pid_controller import PIDController
+from numba import njit
+
+
+# JIT 커널 fastmath 옵션 - 'inf/NaN 없음' 가정(ninf, nnan)은 제외해서
+# NaN 게인이나 inf 입력이 들어와도 파이썬 버전과 같은 결과(NaN/inf 전파)를 냄
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
 
 
 class TemperatureSystem:
@@ -13,6 +19,10 @@ class TemperatureSystem:
     3D 프린터 핫엔드의 열적 특성을 간단히 모델링
     """
     
+    # 인스턴스 __dict__ 대신 고정 슬롯 사용 (메모리 절약, 속성 접근 빠름)
+    __slots__ = ('temp', 'ambient', 'heat_capacity', 'cooling_rate',
+                 '_coef_dt', '_coef_C', '_coef_k', '_decay', '_gain')
+    
     def __init__(self, initial_temp=25, ambient_temp=25):
         """
         온도 시스템 초기화
@@ -32,6 +42,26 @@ class TemperatureSystem:
         # 히터 100% 출력 시 평형 온도
         max_temp = self.ambient + (100.0 / self.heat_capacity) / self.cooling_rate
         
+        # update()용 (decay, gain) 캐시 - (dt, 열용량, 냉각계수)가 바뀔 때만 다시 계산
+        self._coef_dt = None
+        self._coef_C = None
+        self._coef_k = None
+        self._decay = None
+        self._gain = None
+        
+    def step_coefficients(self, dt):
+        """
+        dt 동안의 정확한 해에 쓰는 상수 계산 (dt가 고정이면 한 번만 계산)
+        
+        반환값:
+            (decay, gain)
+            - decay: exp(-냉각계수 × dt), 평형 온도와의 차이가 줄어드는 비율
+            - gain: 1 / (열용량 × 냉각계수), 히터 1%당 평형 온도 상승폭
+        """
+        decay = math.exp(-self.cooling_rate * dt)
+        gain = 1.0 / (self.heat_capacity * self.cooling_rate)
+        return decay, gain
+    
     def update(self, heater_power, dt):
         """
         온도 업데이트 - 물리 법칙 시뮬레이션
@@ -44,24 +74,117 @@ class TemperatureSystem:
             현재 온도 (°C)
             
         물리 모델:
-            온도 변화율 = (가열량 - 냉각량) / 열용량
-            - 가열량: 히터 출력에 비례
-            - 냉각량: (현재온도 - 주변온도)에 비례
+            온도 변화율 = 가열량 - 냉각량
+            - 가열량: 히터 출력 / 열용량
+            - 냉각량: 냉각계수 × (현재온도 - 주변온도)
+            
+            dt 동안 히터 출력이 일정하면(zero-order hold) 1차 시스템의 정확한 해는
+            T(t+dt) = 평형온도 + (T(t) - 평형온도) × exp(-냉각계수 × dt)
+            오일러 적분과 달리 dt를 크게 잡아도 발산하지 않음
+            (exp 계산은 dt나 파라미터가 바뀔 때만 다시 함)
         """
-        # 1. 히터로 인한 온도 상승
-        #    히터 출력이 클수록, 열 용량이 작을수록 빠르게 상승
-        heating = heater_power / self.heat_capacity
+        if (dt != self._coef_dt or self.heat_capacity != self._coef_C
+                or self.cooling_rate != self._coef_k):
+            self._coef_dt = dt
+            self._coef_C = self.heat_capacity
+            self._coef_k = self.cooling_rate
+            self._decay, self._gain = self.step_coefficients(dt)
         
-        # 2. 자연 냉각 (주변 온도로 수렴)
-        #    온도 차이가 클수록, 냉각 계수가 클수록 빠르게 식음
-        cooling = self.cooling_rate * (self.temp - self.ambient)
+        # 1. 현재 히터 출력을 계속 유지했을 때의 평형 온도
+        steady = self.ambient + heater_power * self._gain
         
-        # 3. 온도 변화 = 가열 - 냉각
-        self.temp += (heating - cooling) * dt
+        # 2. 평형 온도와의 차이가 지수적으로 줄어듦
+        self.temp = steady + (self.temp - steady) * self._decay
         
         return self.temp
 
 
+@njit(inline='always', fastmath=_FASTMATH)
+def _step(T, integral, prev_err, sp, Kp, Ki, Kd, dt, inv_dt, decay, gain, Tamb):
+    """
+    한 스텝 계산 - PID 계산 + 출력 제한 + 온도 업데이트를 하나로 합친 함수
+
+    PIDController.update()와 TemperatureSystem.update()를 지역 변수만으로
+    풀어 쓴 것 (self 속성 조회, 메서드 호출 없음)
+    decay, gain은 TemperatureSystem.step_coefficients(dt)의 값
+    inv_dt = 1 / dt (dt > 0은 호출하는 쪽에서 보장 → 0 나눗셈 분기 없음)
+
+    반환값:
+        (새 온도, 적분 누적값, 현재 오차, P, I, D, 히터 출력)
+    """
+    # 1. PID 계산
+    err = sp - T
+    integral += err * dt
+    deriv = (err - prev_err) * inv_dt
+    P = Kp * err
+    I = Ki * integral
+    D = Kd * deriv
+    u = P + I + D
+
+    # 2. 히터 출력 제한 (0~100%) - 스칼라 비교만 사용 (np.clip 호출 없음)
+    p = 100.0 if u > 100.0 else (0.0 if u < 0.0 else u)
+
+    # 3. 온도 업데이트 (한 스텝 동안 출력 일정 → 정확한 해)
+    steady = Tamb + p * gain
+    T_new = steady + (T - steady) * decay
+
+    return T_new, integral, err, P, I, D, p
+
+
+@njit(inline='always', fastmath=_FASTMATH)
+def _batch_step(T, integral, prev_err, sp, Kp, Ki, Kd, dt, inv_dt, decay, gain, Tamb):
+    """
+    _step()의 배치 버전 - 게인 조합 K개를 한 번에 한 스텝 진행
+
+    T, integral, prev_err, Kp, Ki, Kd는 길이 K 배열이고 제자리에서 갱신함
+    (나머지 인자는 _step()과 같은 스칼라)
+    레인끼리 서로 독립이라 컴파일러가 K개를 SIMD 명령(AVX 등) 하나로 묶을 수 있음
+    """
+    for j in range(T.shape[0]):
+        T[j], integral[j], prev_err[j], P, I, D, p = _step(
+            T[j], integral[j], prev_err[j], sp, Kp[j], Ki[j], Kd[j],
+            dt, inv_dt, decay, gain, Tamb)
+
+
+# run_simulation() 결과 배열의 행 순서 (traces[i]가 TRACE_KEYS[i] 시계열)
+TRACE_KEYS = ('times', 'temperatures', 'setpoints', 'heater_powers',
+              'p_terms', 'i_terms', 'd_terms')
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _simulate(Kp, Ki, Kd, sp, dt, T0, Tamb, decay, gain,
+              temps, powers, p_terms, i_terms, d_terms):
+    """
+    시뮬레이션 메인 루프 (Numba JIT 커널)
+
+    매 스텝 _step()을 호출하고, 파이썬 객체/리스트 없이
+    전달받은 배열에 결과를 직접 기록함
+    (내부 상태는 float64로 계산하고 저장할 때만 배열 dtype으로 변환)
+
+    매개변수:
+        Kp, Ki, Kd: PID 게인 값
+        sp: 목표 온도 (°C)
+        dt: 시간 간격 (초, 0보다 커야 함)
+        T0: 시작 온도 (°C)
+        Tamb: 주변 온도 (°C)
+        decay, gain: TemperatureSystem.step_coefficients(dt)의 값
+        temps, powers, p_terms, i_terms, d_terms: 결과를 기록할 배열 (길이 = 반복 횟수)
+    """
+    inv_dt = 1.0 / dt  # 루프 내내 같은 값 → 매 스텝 나눗셈 대신 곱셈
+    T = T0
+    integral = 0.0
+    prev = 0.0
+    for i in range(temps.shape[0]):
+        # 결과는 업데이트 전 온도 기준으로 기록
+        temps[i] = T
+        T, integral, prev, P, I, D, p = _step(
+            T, integral, prev, sp, Kp, Ki, Kd, dt, inv_dt, decay, gain, Tamb)
+        powers[i] = p
+        p_terms[i] = P
+        i_terms[i] = I
+        d_terms[i] = D
+
+
 def run_simulation(Kp, Ki, Kd, target_temp=200, sim_time=300):
     """
     PID 제어 시뮬레이션 실행 - 전체 과정 통합
@@ -73,60 +196,39 @@ def run_simulation(Kp, Ki, Kd, target_temp=200, sim_time=300):
         
     반환값:
         시뮬레이션 데이터를 담은 딕셔너리
+        (각 시계열은 하나의 (7, time_steps) float32 배열 'traces'의 행 view)
     """
     # 1. 시뮬레이션 설정
     dt = 0.1  # 시간 간격 (0.1초마다 계산)
     time_steps = int(sim_time / dt)
     
-    # 2. PID 제어기 생성
-    pid = PIDController(Kp, Ki, Kd, setpoint=target_temp)
-    
-    # 3. 온도 시스템 생성 (실온 25도에서 시작)
+    # 2. 온도 시스템 파라미터 (실온 25도에서 시작)
     system = TemperatureSystem(initial_temp=25, ambient_temp=25)
+    decay, gain = system.step_coefficients(dt)
     
-    # 4. 데이터 저장용 리스트 초기화
-    times = []
-    temperatures = []
-    setpoints = []
-    heater_powers = []
-    p_terms = []
-    i_terms = []
-    d_terms = []
+    # 3. 결과 배열 한 번에 할당 - 행마다 시계열 하나 (TRACE_KEYS 순서)
+    #    각 행이 연속된 메모리라서 시계열별 분석이 캐시 친화적
+    #    그래프/성능 지표에는 float32 정밀도로 충분 → 메모리 사용량 절반
+    traces = np.empty((len(TRACE_KEYS), time_steps), dtype=np.float32)
+    series = dict(zip(TRACE_KEYS, traces))
     
-    # 5. 시뮬레이션 메인 루프
-    for i in range(time_steps):
-        current_time = i * dt
-        current_temp = system.temp
-        
-        # 5-1. PID 제어기로 히터 출력 계산
-        control_output, P, I, D = pid.update(current_temp, dt)
-        
-        # 5-2. 히터 출력 제한 (0~100% 사이로 클리핑)
-        #      실제로는 음수나 100% 이상 출력 불가능
-        heater_power = np.clip(control_output, 0, 100)
-        
-        # 5-3. 시스템 업데이트 (물리 시뮬레이션)
-        new_temp = system.update(heater_power, dt)
-        
-        # 5-4. 데이터 저장 (나중에 그래프 그리기 위해)
-        times.append(current_time)
-        temperatures.append(current_temp)
-        setpoints.append(target_temp)
-        heater_powers.append(heater_power)
-        p_terms.append(P)
-        i_terms.append(I)
-        d_terms.append(D)
+    # 시간(등차수열)과 목표 온도(상수)는 루프 밖에서 한 번에 채움
+    series['times'][:] = np.arange(time_steps) * dt
+    series['setpoints'][:] = target_temp
+    
+    # 4. 시뮬레이션 메인 루프 (JIT 커널 한 번 호출)
+    _simulate(
+        float(Kp), float(Ki), float(Kd), float(target_temp), dt,
+        float(system.temp), float(system.ambient), decay, gain,
+        series['temperatures'], series['heater_powers'],
+        series['p_terms'], series['i_terms'], series['d_terms'])
     
-    # 6. 결과 데이터를 딕셔너리로 반환
+    # 5. 결과 데이터를 딕셔너리로 반환
     return {
-        'times': times,
-        'temperatures': temperatures,
-        'setpoints': setpoints,
-        'heater_powers': heater_powers,
-        'p_terms': p_terms,
-        'i_terms': i_terms,
-        'd_terms': d_terms,
+        **series,
+        'traces': traces,
+        'dt': dt,
         'Kp': Kp,
         'Ki': Ki,
         'Kd': Kd
-    }
\ No newline at end of file
+    }
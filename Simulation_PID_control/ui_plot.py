@@ -5,10 +5,22 @@ UI and Plotting Module
 
 import numpy as np
 import matplotlib.pyplot as plt
+import matplotlib.font_manager as fm
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
 import platform
+from functools import lru_cache
 from temperature_system import run_simulation
 
 
+@lru_cache(maxsize=1)
+def _available_fonts():
+    """
+    설치된 폰트 이름 집합 (처음 한 번만 만들고 재사용)
+    """
+    return {f.name for f in fm.fontManager.ttflist}
+
+
 def setup_korean_font():
     """
     운영체제에 맞는 한글 폰트 설정
@@ -28,8 +40,7 @@ def setup_korean_font():
         font_name = font_candidates[0]
         
         # 설치된 폰트 확인
-        import matplotlib.font_manager as fm
-        available_fonts = [f.name for f in fm.fontManager.ttflist]
+        available_fonts = _available_fonts()
         
         for font in font_candidates:
             if font in available_fonts:
@@ -83,12 +94,18 @@ def plot_results(data):
     axes[1].set_ylim([-5, 105])
     
     # --- 3. PID 각 항 그래프 ---
-    axes[2].plot(times, p_terms, 'r-', label='P (비례)', alpha=0.7)
-    axes[2].plot(times, i_terms, 'b-', label='I (적분)', alpha=0.7)
-    axes[2].plot(times, d_terms, 'g-', label='D (미분)', alpha=0.7)
+    # 세 항이 같은 x축을 쓰므로 LineCollection 하나로 그림 (Line2D 3개 대신)
+    colors = ['r', 'b', 'g']
+    labels = ['P (비례)', 'I (적분)', 'D (미분)']
+    segments = np.stack([np.column_stack([times, terms])
+                         for terms in (p_terms, i_terms, d_terms)])
+    axes[2].add_collection(LineCollection(segments, colors=colors, alpha=0.7))
+    axes[2].autoscale()
     axes[2].set_xlabel('시간 (초)', fontsize=12)
     axes[2].set_ylabel('기여도', fontsize=12)
-    axes[2].legend(loc='best')
+    # 범례는 색상별 대표 선으로 따로 구성
+    handles = [Line2D([], [], color=c, alpha=0.7) for c in colors]
+    axes[2].legend(handles, labels, loc='best')
     axes[2].grid(True, alpha=0.3)
     axes[2].set_title('PID 각 항의 기여도')
     
@@ -96,16 +113,20 @@ def plot_results(data):
     plt.show()
 
 
-def print_performance(data):
+def analyze_performance(data):
     """
-    성능 지표 출력 및 분석
+    성능 지표 계산 (출력 없이 값만 반환)
     
     매개변수:
         data: run_simulation()에서 반환된 딕셔너리
+        
+    반환값:
+        'settling_time' (초, 수렴하지 못하면 None), 'overshoot' (°C),
+        'overshoot_percent' (%), 'mse'를 담은 딕셔너리
     """
-    times = data['times']
-    temps = np.array(data['temperatures'])
-    setpoints = np.array(data['setpoints'])
+    # run_simulation()이 NumPy 배열(traces의 행 view)을 반환하므로 변환 없이 바로 사용
+    temps = data['temperatures']
+    setpoints = data['setpoints']
     errors = setpoints - temps
     
     # --- 1. 정상 상태 도달 시간 계산 ---
@@ -113,13 +134,47 @@ def print_performance(data):
     tolerance = setpoints[0] * 0.02
     steady_state_idx = None
     
-    for i in range(len(errors)):
-        if abs(errors[i]) <= tolerance:
-            # 이후로 계속 범위 내에 있는지 확인 (50개 샘플)
-            check_length = min(50, len(errors) - i)
-            if all(abs(errors[i:i+check_length]) <= tolerance):
-                steady_state_idx = i
-                break
+    # 이후로 계속 범위 내에 있는지 확인 (50개 샘플)
+    # 끝부분은 남은 샘플만 검사하도록 True로 채운 뒤 슬라이딩 윈도우로 한 번에 판정
+    check_length = 50
+    inside = np.abs(errors) <= tolerance
+    padded = np.concatenate([inside, np.ones(check_length - 1, dtype=bool)])
+    windows = np.lib.stride_tricks.sliding_window_view(padded, check_length)
+    ok = windows.all(axis=1)
+    if ok.any():
+        steady_state_idx = int(np.argmax(ok))
+    
+    if steady_state_idx is not None:
+        # float32 시간축 대신 인덱스 × dt로 계산 (반올림 오차 없이 0.1초 단위)
+        settling_time = steady_state_idx * data['dt']
+    else:
+        settling_time = None
+    
+    # --- 2. 최대 오버슈트 ---
+    # 목표값을 넘어선 최대 온도
+    overshoot = float(np.max(temps) - setpoints[0])
+    overshoot_percent = float(overshoot / setpoints[0]) * 100
+    
+    # --- 3. 평균 제곱 오차 (MSE) ---
+    # 전체 시뮬레이션 동안의 평균 오차 (내적으로 계산 → 제곱 임시 배열 없음)
+    mse = float(errors @ errors) / errors.size
+    
+    return {
+        'settling_time': settling_time,
+        'overshoot': overshoot,
+        'overshoot_percent': overshoot_percent,
+        'mse': mse
+    }
+
+
+def print_performance(data):
+    """
+    성능 지표 출력 및 분석
+    
+    매개변수:
+        data: run_simulation()에서 반환된 딕셔너리
+    """
+    perf = analyze_performance(data)
     
     # --- 출력 시작 ---
     print("\n" + "=" * 50)
@@ -127,21 +182,16 @@ def print_performance(data):
     print("=" * 50)
     
     # 정상 상태 도달 시간
-    if steady_state_idx:
-        print(f"정상상태 도달 시간: {times[steady_state_idx]:.1f}초")
+    if perf['settling_time'] is not None:
+        print(f"정상상태 도달 시간: {perf['settling_time']:.1f}초")
     else:
         print("정상상태 도달 시간: 측정 불가 (목표에 수렴하지 못함)")
     
-    # --- 2. 최대 오버슈트 ---
-    # 목표값을 넘어선 최대 온도
-    overshoot = np.max(temps) - setpoints[0]
-    overshoot_percent = (overshoot / setpoints[0]) * 100
-    print(f"최대 오버슈트: {overshoot:.1f}°C ({overshoot_percent:.1f}%)")
+    # 최대 오버슈트
+    print(f"최대 오버슈트: {perf['overshoot']:.1f}°C ({perf['overshoot_percent']:.1f}%)")
     
-    # --- 3. 평균 제곱 오차 (MSE) ---
-    # 전체 시뮬레이션 동안의 평균 오차
-    mse = np.mean(errors**2)
-    print(f"평균 제곱 오차 (MSE): {mse:.2f}")
+    # 평균 제곱 오차 (MSE)
+    print(f"평균 제곱 오차 (MSE): {perf['mse']:.2f}")
     print("=" * 50 + "\n")
 
 